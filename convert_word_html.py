@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""Convert a Word-exported HTML file into Markdown and plain text.
+
+Word's "save as web page" output is full of MSO-specific markup (style
+blocks, ``v:``/``o:``/``w:`` namespace tags, ``mso-*`` attributes).  This
+script strips all of that and emits a clean ``.md`` and ``.txt`` next to
+the input file.
+
+Usage:
+    python convert_word_html.py <exported.html>
+"""
+
+import codecs
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import lxml.html
+
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+# Whitespace cleanup for the generated Markdown, compiled once at import.
+_MULTI_BLANK = re.compile(r'\n\s*\n\s*\n')
+_TRAIL_WS = re.compile(r'[ \t]+\n')
+_LEAD_WS = re.compile(r'\n[ \t]+')
+# Cheaper forms for the Markdown cleanup: tabs are normalized first, so
+# trailing whitespace is plain spaces and blank runs are bare newlines.
+_TRAIL_SP = re.compile(r' +\n')
+_MULTI_NL = re.compile(r'\n{3,}')
+_MULTI_SPACE = re.compile(r'[ \t]+')
+_INLINE_WS = re.compile(r'[ \t\r\n]+')
+
+_MSO_ATTR_RE = re.compile(r'mso-|microsoft|word|office', re.IGNORECASE)
+# Word vector/office/word namespace tags carry no content we want.
+_WORD_NS_PREFIXES = ('v:', 'o:', 'w:')
+
+
+def read_html_file(file_path):
+    """Read the raw HTML bytes; decoding is left to the parser."""
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+
+def detect_encoding(raw):
+    """Detect the document encoding from its first 64 KB.
+
+    Uses charset_normalizer's single C-level pass when available and
+    falls back to gb2312, Word's usual export encoding here.
+    """
+    if charset_normalizer is not None:
+        best = charset_normalizer.from_bytes(raw[:65536]).best()
+        if best is not None and best.encoding:
+            # Normalize names like 'utf_8' to a canonical codec name.
+            return codecs.lookup(best.encoding).name
+    return 'gb2312'
+
+
+def _is_mso_class(name):
+    # Inlined substring checks: cheaper than a generator over a fragment
+    # tuple for the short class names Word emits.
+    lowered = name.lower()
+    return ('mso' in lowered or 'microsoft' in lowered
+            or 'word' in lowered or 'office' in lowered)
+
+
+def clean_mso_attributes(body):
+    """Strip MSO-specific attributes, namespace tags and style blocks.
+
+    Operates directly on the lxml element tree, so attribute removal is
+    a plain dict operation instead of going through bs4's wrappers.
+    """
+    for element in list(body.iter()):
+        tag = element.tag
+        if not isinstance(tag, str):
+            # Comments and processing instructions.
+            continue
+        if tag.startswith(_WORD_NS_PREFIXES):
+            element.drop_tree()
+            continue
+        if tag == 'style':
+            if element.text and 'mso' in element.text.lower():
+                element.drop_tree()
+            continue
+        attrib = element.attrib
+        if not attrib:
+            continue
+        for attr_name in list(attrib):
+            attr_value = attrib[attr_name]
+            if attr_name == 'class':
+                classes = attr_value.split()
+                kept = [c for c in classes if not _is_mso_class(c)]
+                if len(kept) != len(classes):
+                    if kept:
+                        attrib['class'] = ' '.join(kept)
+                    else:
+                        del attrib['class']
+            elif _MSO_ATTR_RE.search(attr_value):
+                del attrib[attr_name]
+
+
+def clean_html_content(html_content):
+    """Parse the Word HTML with lxml and return the cleaned ``<body>``."""
+    if isinstance(html_content, bytes):
+        parser = lxml.html.HTMLParser(encoding=detect_encoding(html_content))
+        tree = lxml.html.document_fromstring(html_content, parser=parser)
+    else:
+        tree = lxml.html.document_fromstring(html_content)
+    body = tree.body
+
+    for element in list(body.iter('style', 'script')):
+        element.drop_tree()
+
+    clean_mso_attributes(body)
+
+    # Word pads documents with empty paragraphs and divs. itertext is a
+    # generator, so the scan stops at the first non-whitespace character
+    # instead of materializing the whole subtree's text.
+    for element in list(body.iter('p', 'div')):
+        if not any(s.strip() for s in element.itertext()):
+            parent = element.getparent()
+            if parent is not None:
+                element.drop_tree()
+
+    return body
+
+
+def _collapse(text):
+    return _INLINE_WS.sub(' ', text).strip()
+
+
+def _emit_children(node, out):
+    if node.text:
+        out.append(_INLINE_WS.sub(' ', node.text))
+    for child in node:
+        _emit(child, out)
+        if child.tail:
+            out.append(_INLINE_WS.sub(' ', child.tail))
+
+
+def _make_heading(level):
+    prefix = '\n' + '#' * level + ' '
+
+    def handler(node, out):
+        out.append(prefix)
+        _emit_children(node, out)
+        out.append('\n\n')
+
+    return handler
+
+
+def _emit_paragraph(node, out):
+    _emit_children(node, out)
+    out.append('\n\n')
+
+
+def _emit_anchor(node, out):
+    text = _collapse(node.text_content())
+    href = node.get('href', '')
+    if href:
+        out.append(f'[{text}]({href})')
+    else:
+        out.append(text)
+
+
+def _emit_strong(node, out):
+    out.append('**')
+    _emit_children(node, out)
+    out.append('**')
+
+
+def _emit_em(node, out):
+    out.append('*')
+    _emit_children(node, out)
+    out.append('*')
+
+
+def _emit_list(node, out):
+    _emit_children(node, out)
+    out.append('\n')
+
+
+def _emit_list_item(node, out):
+    parent = node.getparent()
+    out.append('1. ' if parent is not None and parent.tag == 'ol' else '- ')
+    _emit_children(node, out)
+    out.append('\n')
+
+
+def _emit_break(node, out):
+    out.append('\n')
+
+
+def _emit_table(node, out):
+    for i, row in enumerate(node.iter('tr')):
+        # Render each cell through the normal emitter so inline markup
+        # (links especially) survives, then flatten it onto one line.
+        cells = []
+        for cell in row.iter('td', 'th'):
+            cell_out = []
+            _emit_children(cell, cell_out)
+            cells.append(_collapse(''.join(cell_out)))
+        out.append('| ' + ' | '.join(cells) + ' |\n')
+        if i == 0:
+            out.append('|' + ' --- |' * len(cells) + '\n')
+    out.append('\n')
+
+
+# Tags actually present in Word exports; anything else just recurses.
+_EMITTERS = {
+    'h1': _make_heading(1),
+    'h2': _make_heading(2),
+    'h3': _make_heading(3),
+    'h4': _make_heading(4),
+    'h5': _make_heading(5),
+    'h6': _make_heading(6),
+    'p': _emit_paragraph,
+    'div': _emit_paragraph,
+    'a': _emit_anchor,
+    'strong': _emit_strong,
+    'b': _emit_strong,
+    'em': _emit_em,
+    'i': _emit_em,
+    'ul': _emit_list,
+    'ol': _emit_list,
+    'li': _emit_list_item,
+    'br': _emit_break,
+    'table': _emit_table,
+}
+
+
+def _emit(node, out):
+    tag = node.tag
+    if not isinstance(tag, str):
+        return
+    handler = _EMITTERS.get(tag)
+    if handler is not None:
+        handler(node, out)
+    else:
+        _emit_children(node, out)
+
+
+def convert_to_markdown(body):
+    """Emit Markdown directly from the cleaned tree in a single walk."""
+    out = []
+    _emit(body, out)
+    markdown = ''.join(out).replace('\t', ' ')
+
+    markdown = _TRAIL_SP.sub('\n', markdown)
+    markdown = _LEAD_WS.sub('\n', markdown)
+    markdown = _MULTI_NL.sub('\n\n', markdown)
+    return markdown.strip() + '\n'
+
+
+def convert_to_text(body):
+    """Extract plain text from the cleaned tree."""
+    text = '\n'.join(body.itertext())
+
+    text = _MULTI_SPACE.sub(' ', text)
+    text = _MULTI_BLANK.sub('\n\n', text)
+    text = _TRAIL_WS.sub('\n', text)
+    return text.strip() + '\n'
+
+
+def main():
+    if len(sys.argv) < 2:
+        print('Usage: python convert_word_html.py <exported.html>')
+        sys.exit(1)
+
+    input_file = Path(sys.argv[1])
+    if not input_file.exists():
+        print(f'File not found: {input_file}')
+        sys.exit(1)
+
+    output_md = input_file.with_suffix('.md')
+    output_txt = input_file.with_suffix('.txt')
+
+    print(f'Reading {input_file} ...')
+    html_content = read_html_file(input_file)
+
+    print('Cleaning Word markup ...')
+    body = clean_html_content(html_content)
+
+    # Both converters only read the tree, and lxml releases the GIL for
+    # much of the C-level work, so they can overlap. Writes stay
+    # sequential to avoid contending on the disk.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        md_future = executor.submit(convert_to_markdown, body)
+        txt_future = executor.submit(convert_to_text, body)
+        markdown_content = md_future.result()
+        text_content = txt_future.result()
+
+    md_lines = markdown_content.count('\n')
+    txt_lines = text_content.count('\n')
+
+    # Encode each document once and write the bytes directly, instead of
+    # pushing the str through a text-mode codec on write.
+    with open(output_md, 'wb') as f:
+        f.write(markdown_content.encode('utf-8'))
+    print(f'Wrote {output_md} ({md_lines} lines)')
+
+    with open(output_txt, 'wb') as f:
+        f.write(text_content.encode('utf-8'))
+    print(f'Wrote {output_txt} ({txt_lines} lines)')
+
+    print('Done.')
+    print(f'  markdown: {md_lines} lines')
+    print(f'  text:     {txt_lines} lines')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Extract a section of the converted paper list and build an analysis report.
+
+Works on the Markdown produced by ``convert_word_html.py``: finds the
+requested section by its header, pulls the paper table rows out of it and
+writes a per-paper analysis report.
+
+Usage:
+    python extract_section.py <papers.md> [section title] [output.md]
+"""
+
+import functools
+import re
+import sys
+from pathlib import Path
+
+# Header detection for Markdown section boundaries; the captured hashes
+# give the header level in the same match.
+_HEADER = re.compile(r'^(#+)\s')
+
+# A full table row containing a linked paper title, matched line-by-line
+# over the whole section in one scan.
+_ROW = re.compile(
+    r'^(?P<line>[^\n]*?\[(?P<title>[^\]]+)\]\((?P<url>[^)]+)\)[^\n]*)$',
+    re.MULTILINE)
+
+# Rows that lost their pipes sometimes carry labelled fields instead.
+_LABELLED_FIELD = re.compile(
+    r'(核心问题|研究问题|切入点|数据挖掘方法|方法|期刊|年份)[:：]\s*([^|，,;；]+)')
+
+# Phrases that introduce the research problem a paper addresses,
+# folded into one alternation so non-matching text is scanned once.
+_ENTRY_RE = re.compile(r'''
+    (?:针对|面向|解决)([^，。;；]{2,40})(?:问题|挑战)
+    |(?:研究|探讨|分析)了?([^，。;；]{2,40})
+    |(?:旨在|目的是)([^，。;；]{2,40})
+    |(?:address|study|investigate)(?:es|s|d)?\s+(?:the\s+)?([^,.;]{2,60})
+    |(?:problem|issue)\s+of\s+([^,.;]{2,60})
+''', re.VERBOSE)
+
+# Data-mining techniques worth surfacing in the report.
+_TECH_RE = re.compile(r'''
+    (复杂网络[^，。;；]{0,16})
+    |(社区发现|社团检测|网络分析)
+    |(聚类[^，。;；]{0,10}|分类[^，。;；]{0,10})
+    |(机器学习|深度学习|神经网络)
+    |(关联规则|频繁模式|时间序列)
+    |(network\ analysis|graph\ mining|link\ prediction)
+    |(clustering|classification|regression|embedding)
+''', re.IGNORECASE | re.VERBOSE)
+
+# Used by the fallback section search when no header matches the title.
+_COMPLEX_KEYWORDS = ('复杂网络', '网络分析', '数据挖掘',
+                     'complex network', 'data mining')
+
+
+def load_markdown_file(file_path):
+    """Read the Markdown document as a list of lines."""
+    return Path(file_path).read_text(encoding='utf-8').splitlines()
+
+
+@functools.lru_cache(maxsize=32)
+def _section_pattern(section_title):
+    """Build the combined header pattern for a section title.
+
+    Cached because the title-derived pattern is rebuilt for every file in
+    a batch run, and f-string-built patterns tend to evict entries from
+    re's internal cache.
+    """
+    escaped = re.escape(section_title)
+    # One alternation, ordered strictest first; group number = strictness.
+    return re.compile('|'.join(f'({p})' for p in (
+        rf'^#+\s*{escaped}\s*$',
+        rf'^#+\s*.*{escaped}.*$',
+        rf'^\*\*\s*{escaped}\s*\*\*$',
+        rf'^{escaped}\s*$',
+    )), re.IGNORECASE)
+
+
+def find_section(lines, section_title):
+    """Return the lines under the header ``section_title``.
+
+    Tries progressively looser header patterns; if none match, falls back
+    to collecting header-delimited blocks that mention the usual keywords.
+    Returns a list of lines (``None`` when nothing relevant is found).
+    """
+    combined = _section_pattern(section_title)
+
+    section_start = None
+    best_rank = None
+    for i, line in enumerate(lines):
+        match = combined.match(line.strip())
+        if match:
+            rank = match.lastindex
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                section_start = i
+                if rank == 1:
+                    break
+
+    if section_start is not None:
+        # Match headers on the stripped line, exactly as the section
+        # pattern did, so indented headers get the right level.
+        header_match = _HEADER.match(lines[section_start].strip())
+        start_level = len(header_match.group(1)) if header_match else 1
+        section_end = len(lines)
+        for i in range(section_start + 1, len(lines)):
+            header_match = _HEADER.match(lines[i].strip())
+            if header_match and len(header_match.group(1)) <= start_level:
+                section_end = i
+                break
+        return lines[section_start:section_end]
+
+    # Fallback: collect header-delimited blocks with relevant content.
+    # Track keyword hits per block as lines arrive instead of re-joining
+    # the whole block for every header encountered.
+    sections = []
+    current_section = []
+    seen_keywords = set()
+    for line in lines:
+        if _HEADER.match(line) and current_section:
+            if seen_keywords:
+                sections.extend(current_section)
+                sections.append('')
+            current_section = [line]
+            seen_keywords = {kw for kw in _COMPLEX_KEYWORDS if kw in line}
+        else:
+            current_section.append(line)
+            seen_keywords.update(kw for kw in _COMPLEX_KEYWORDS if kw in line)
+    if current_section and seen_keywords:
+        sections.extend(current_section)
+
+    if sections:
+        return sections
+    return None
+
+
+def extract_table_cells_from_line(line):
+    """Split a Markdown table row into its cell texts."""
+    parts = [p.strip() for p in line.split('|')]
+    # Rejoin cells whose pipe was escaped as \|.
+    cells = []
+    for part in parts:
+        if cells and cells[-1].endswith('\\'):
+            cells[-1] = cells[-1][:-1] + '|' + part
+        else:
+            cells.append(part)
+    # Drop the empty edges produced by the leading/trailing pipes.
+    if cells and not cells[0]:
+        cells = cells[1:]
+    if cells and not cells[-1]:
+        cells = cells[:-1]
+
+    if len(cells) < 6:
+        labelled = _LABELLED_FIELD.findall(line)
+        if labelled and len(labelled) > len(cells):
+            cells = [value.strip() for _, value in labelled]
+    return cells
+
+
+def extract_research_details(paper):
+    """Derive the research entry point and methods for one paper."""
+    research_entry = paper.get('core_problem', '')
+    known_methods = paper.get('data_mining_methods', '')
+    # Rows whose table cells already filled both fields need no regex work.
+    if research_entry and known_methods:
+        return {
+            'research_entry_point': research_entry,
+            'data_mining_methods': known_methods,
+        }
+
+    context = paper.get('context', '')
+
+    if not research_entry:
+        match = _ENTRY_RE.search(context)
+        if match:
+            research_entry = next(g for g in match.groups() if g).strip()
+
+    if not known_methods:
+        methods = []
+        for match in _TECH_RE.finditer(context):
+            technique = match.group(match.lastindex).strip()
+            if technique not in methods:
+                methods.append(technique)
+        known_methods = '、'.join(methods)
+
+    return {
+        'research_entry_point': research_entry,
+        'data_mining_methods': known_methods,
+    }
+
+
+def _iter_rows(section_content):
+    """Yield ``_ROW`` matches from a section given as lines or a string."""
+    if isinstance(section_content, str):
+        yield from _ROW.finditer(section_content)
+    else:
+        for line in section_content:
+            match = _ROW.match(line)
+            if match:
+                yield match
+
+
+def extract_papers_from_section(section_content):
+    """Pull one paper record out of every table row with a Markdown link.
+
+    A single scan of the section with ``_ROW`` replaces the old per-line
+    strip/match/split loop; the matched row then goes through the usual
+    cell splitter, keeping its escaped-pipe and labelled-field handling.
+    Accepts the section as a list of lines or as a single string.
+    """
+    papers = []
+    for number, match in enumerate(_iter_rows(section_content), start=1):
+        cells = extract_table_cells_from_line(match.group('line'))
+        paper = {
+            'number': number,
+            'title': match.group('title').strip(),
+            'url': match.group('url').strip(),
+            'core_problem': cells[2] if len(cells) > 2 else '',
+            'data_mining_methods': cells[3] if len(cells) > 3 else '',
+            'context': match.group('line').strip(),
+        }
+        paper.update(extract_research_details(paper))
+        papers.append(paper)
+    return papers
+
+
+def generate_analysis_report(papers, output_file):
+    """Write the per-paper analysis report as Markdown.
+
+    The report is assembled in memory (one formatted block per paper)
+    and written with a single call, rather than a dozen small writes per
+    paper each paying lock/encode overhead.
+    """
+    parts = [
+        '# 论文分析报告\n\n',
+        f'共收录 {len(papers)} 篇论文。\n\n',
+    ]
+    for paper in papers:
+        core_problem = (f"- 核心问题: {paper['core_problem']}\n"
+                        if paper.get('core_problem') else '')
+        parts.append(
+            f"## {paper['number']}. {paper['title']}\n\n"
+            f"- 链接: {paper['url']}\n"
+            f"{core_problem}"
+            f"- 研究切入点: {paper.get('research_entry_point') or '待补充'}\n"
+            f"- 数据挖掘方法: {paper.get('data_mining_methods') or '待补充'}\n\n"
+            "### 原始条目\n\n"
+            f"> {paper['context']}\n\n"
+            "---\n\n"
+        )
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
+
+
+def main():
+    if len(sys.argv) < 2:
+        print('Usage: python extract_section.py <papers.md> '
+              '[section title] [output.md]')
+        sys.exit(1)
+
+    input_file = Path(sys.argv[1])
+    if not input_file.exists():
+        print(f'File not found: {input_file}')
+        sys.exit(1)
+
+    section_title = sys.argv[2] if len(sys.argv) > 2 else '复杂网络与数据挖掘'
+    output_file = (Path(sys.argv[3]) if len(sys.argv) > 3
+                   else input_file.with_name(input_file.stem + '_分析报告.md'))
+
+    lines = load_markdown_file(input_file)
+    section = find_section(lines, section_title)
+    if section is None:
+        print(f'Section not found: {section_title}')
+        sys.exit(1)
+
+    papers = extract_papers_from_section(section)
+    print(f'Found {len(papers)} papers in "{section_title}"')
+
+    generate_analysis_report(papers, output_file)
+    print(f'Wrote {output_file}')
+
+
+if __name__ == '__main__':
+    main()